@@ -1,6 +1,9 @@
 import asyncio
 import logging
+import os
+import sys
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import settings
@@ -12,10 +15,48 @@ logger = logging.getLogger(__name__)
 
 async def migrate_tables() -> None:
     logger.info("Starting to migrate")
+    reset = "--reset" in sys.argv
+    if reset and os.environ.get("ALLOW_DESTRUCTIVE_MIGRATION") != "1":
+        raise SystemExit("--reset drops all tables; set ALLOW_DESTRUCTIVE_MIGRATION=1 to confirm")
+
     engine = create_async_engine(settings.DATABASE_URL)
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        if reset:
+            logger.warning("Dropping all tables (--reset)")
+            await conn.run_sync(Base.metadata.drop_all)
+        # create_all skips tables that already exist (checkfirst), so normal
+        # runs are idempotent and never touch data.
         await conn.run_sync(Base.metadata.create_all)
+        # Upgrade pre-existing databases in place: tables created before this
+        # series have json payload columns (which GIN cannot index) and lack
+        # the composite pagination index, and create_all's checkfirst skips
+        # them. ALTER ... TYPE JSONB is a no-op when the column already is.
+        await conn.execute(
+            text("ALTER TABLE completion_logs ALTER COLUMN input_data TYPE JSONB USING input_data::jsonb")
+        )
+        await conn.execute(
+            text("ALTER TABLE completion_logs ALTER COLUMN output_data TYPE JSONB USING output_data::jsonb")
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_completion_logs_app_created "
+                "ON completion_logs (application_id, created_at DESC)"
+            )
+        )
+        # GIN jsonb_path_ops indexes support @> containment lookups on the log
+        # payloads; expressed as raw DDL since Base.metadata has no GIN support.
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_completion_logs_input_gin "
+                "ON completion_logs USING GIN (input_data jsonb_path_ops)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_completion_logs_output_gin "
+                "ON completion_logs USING GIN (output_data jsonb_path_ops)"
+            )
+        )
 
     logger.info("Done migrating")
 
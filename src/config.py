@@ -5,6 +5,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     OPENAI_API_KEY: str
     OPENAI_MODEL: str
+    MAX_CONCURRENT_LLM_CALLS: int = 32
 
 
 settings = Settings()
@@ -2,7 +2,8 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Text, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
@@ -42,7 +43,16 @@ class CompletionLog(Base):
         nullable=False,
         index=True,
     )
-    input_data: Mapped[dict] = mapped_column(JSON, nullable=False)
-    output_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    input_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    output_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now(), nullable=False)
     application: Mapped["Application"] = relationship(back_populates="completion_logs")
+
+
+# Covers the paginated log listing: ORDER BY created_at DESC LIMIT N for one
+# application resolves with an index scan instead of a sort.
+Index(
+    "ix_completion_logs_app_created",
+    CompletionLog.application_id,
+    CompletionLog.created_at.desc(),
+)
@@ -22,6 +22,12 @@ class OutputValidationException(Exception):
     pass
 
 
+class InvalidCursorException(Exception):
+    """Raised when a pagination cursor cannot be decoded"""
+
+    pass
+
+
 class LLMCallException(Exception):
     """Raised when there is an error in calling the LLM"""
 
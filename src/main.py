@@ -1,28 +1,58 @@
 import uuid
+from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.future import select
 
 import src.schemas as schemas
-from src.database.session import get_db_session
+from src.database.session import readonly_session
 from src.exceptions import (
     ApplicationNotFoundException,
     InputValidationException,
+    InvalidCursorException,
     OutputValidationException,
     SchemaValidationException,
 )
-from src.service import ApplicationService, get_application_service
+from src.service import (
+    ApplicationService,
+    get_application_service,
+    get_readonly_application_service,
+    openai_client,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await openai_client.close()
+
 
-app = FastAPI(title="LLM Application Server")
+app = FastAPI(title="LLM Application Server", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Validates a whole page of ORM rows in one pydantic-core call instead of a
+# per-item model_validate loop.
+_logs_adapter = TypeAdapter(list[schemas.CompletionLog])
+
+# Short-TTL response caches for idempotent endpoints that monitors and
+# dashboards poll far more often than their answers change.
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=1)
+_logs_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
 
 
 @app.get("/health")
-async def health(session: AsyncSession = Depends(get_db_session)):
-    try:
-        await session.execute(select(1))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def health():
+    # A successful probe within the last second answers without touching the
+    # database or opening a session at all.
+    if "ok" not in _health_cache:
+        try:
+            async with readonly_session() as session:
+                await session.execute(select(1))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        _health_cache["ok"] = True
     return {"status": "ok"}
 
 
@@ -82,23 +112,39 @@ async def generate_response(
 @app.get("/applications/{application_id}/completions/logs")
 async def get_request_logs(
     application_id: uuid.UUID,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number, starting from 1"),
     size: int = Query(10, ge=1, description="Number of items per page"),
-    application_service: ApplicationService = Depends(get_application_service),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous page; takes precedence over page"),
+    application_service: ApplicationService = Depends(get_readonly_application_service),
 ) -> schemas.PaginatedCompletionLogResponse:
+    response.headers["Cache-Control"] = "max-age=5"
+
+    cache_key = (application_id, page, size, cursor)
+    cached = _logs_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        paginated_logs, total = await application_service.get_request_logs(application_id, page, size)
+        paginated_logs, total, next_cursor = await application_service.get_request_logs(
+            application_id, page, size, cursor
+        )
     except ApplicationNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
     total_pages = (total + size - 1) // size
 
-    return schemas.PaginatedCompletionLogResponse(
+    logs_response = schemas.PaginatedCompletionLogResponse(
         total=total,
         page=page,
         size=size,
         total_pages=total_pages,
-        items=[schemas.CompletionLog.model_validate(log) for log in paginated_logs],
+        next_cursor=next_cursor,
+        items=_logs_adapter.validate_python(paginated_logs, from_attributes=True),
     )
+    _logs_cache[cache_key] = logs_response
+    return logs_response
@@ -42,4 +42,5 @@ class PaginatedCompletionLogResponse(BaseModel):
     page: int
     size: int
     total_pages: int
+    next_cursor: str | None = None
     items: list[CompletionLog]
@@ -1,33 +1,112 @@
-import json
+import asyncio
+import base64
+import binascii
+import random
 import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, NamedTuple, Tuple
 
+import fastjsonschema
+import httpx
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends
-from jsonschema import Draft7Validator, ValidationError, validate
-from openai import AsyncOpenAI
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
+from sqlalchemy import insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_random_exponential,
-)
 
 from src.config import settings
 from src.database import models
-from src.database.session import get_db_session
+from src.database.session import get_db_session, get_readonly_db_session
 from src.exceptions import (
     ApplicationNotFoundException,
     InputValidationException,
+    InvalidCursorException,
     LLMCallException,
     OutputValidationException,
     SchemaValidationException,
 )
+from src.validation import compile_validator, validate_schema
 
+# Tuned transport for the OpenAI SDK: a larger keep-alive pool and HTTP/2
+# multiplexing for concurrent completions. SDK retries are disabled because
+# _call_llm runs its own retry loop. Closed by the app lifespan on shutdown.
 openai_client = AsyncOpenAI(
     api_key=settings.OPENAI_API_KEY,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    ),
+    max_retries=0,
 )
 
+_LLM_RETRY_ATTEMPTS = 3
+
+# Bound in-flight OpenAI calls so concurrent requests overlap network I/O
+# without blowing through per-minute rate limits.
+_llm_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM_CALLS)
+
+_Validator = Callable[[Dict[str, Any]], Any]
+
+
+class ApplicationRecord(NamedTuple):
+    """Detached snapshot of an Application row, safe to cache across sessions."""
+
+    id: uuid.UUID
+    prompt_config: str
+    input_schema: dict
+    output_schema: dict
+    response_format: dict
+
+
+def _build_response_format(output_schema: dict) -> dict:
+    """Build the OpenAI structured-output response_format once per application."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "response_schema",
+            "schema": {**output_schema, "additionalProperties": False},
+            "strict": True,
+        },
+    }
+
+
+# Hot applications are served from a per-worker TTL cache: prompt and schemas
+# only change on create/delete, both of which invalidate the entry explicitly.
+_application_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Validators are compiled once per application (schemas change only on
+# create/delete) so the hot path never walks the schema tree per request.
+_app_validators: dict[uuid.UUID, Tuple[_Validator, _Validator]] = {}
+
+
+def _encode_cursor(log: models.CompletionLog) -> str:
+    raw = f"{log.created_at.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at_raw, id_raw = raw.split("|")
+        return datetime.fromisoformat(created_at_raw), uuid.UUID(id_raw)
+    except (ValueError, binascii.Error) as e:
+        raise InvalidCursorException(f"Invalid cursor: {str(e)}")
+
+
+def _get_app_validators(application: ApplicationRecord) -> Tuple[_Validator, _Validator]:
+    validators = _app_validators.get(application.id)
+    if validators is None:
+        validators = (
+            compile_validator(application.input_schema),
+            compile_validator(application.output_schema),
+        )
+        _app_validators[application.id] = validators
+    return validators
+
 
 class ApplicationService:
     def __init__(self, db_session: AsyncSession):
@@ -40,49 +119,76 @@ class ApplicationService:
         output_schema: dict,
     ) -> models.Application:
         try:
-            Draft7Validator.check_schema(input_schema)
-            Draft7Validator.check_schema(output_schema)
+            validate_schema(input_schema)
+            validate_schema(output_schema)
         except Exception as e:
             raise SchemaValidationException(f"Schema validation error: {str(e)}")
 
         application = models.Application(
             prompt_config=prompt_config, input_schema=input_schema, output_schema=output_schema
         )
+        # No refresh afterwards: id is generated client-side by the column
+        # default, which is all the create response needs, so the extra
+        # SELECT round-trip buys nothing.
         self._session.add(application)
         await self._session.commit()
-        await self._session.refresh(application)
+
+        # Prime the caches so the first completion request skips both the
+        # application fetch and validator compilation.
+        record = ApplicationRecord(
+            application.id, prompt_config, input_schema, output_schema, _build_response_format(output_schema)
+        )
+        _application_cache[application.id] = record
+        _get_app_validators(record)
         return application
 
-    async def get_application(self, application_id: uuid.UUID) -> models.Application:
+    async def get_application(self, application_id: uuid.UUID) -> ApplicationRecord:
+        record = _application_cache.get(application_id)
+        if record is not None:
+            return record
+
         application = await self._session.get(models.Application, application_id)
         if not application:
             raise ApplicationNotFoundException("Application not found")
-        return application
+
+        record = ApplicationRecord(
+            application.id,
+            application.prompt_config,
+            application.input_schema,
+            application.output_schema,
+            _build_response_format(application.output_schema),
+        )
+        _application_cache[application_id] = record
+        return record
 
     async def delete_application(self, application_id: uuid.UUID) -> None:
-        application = await self.get_application(application_id)
+        application = await self._session.get(models.Application, application_id)
+        if not application:
+            raise ApplicationNotFoundException("Application not found")
 
         await self._session.delete(application)
+        _application_cache.pop(application_id, None)
+        _app_validators.pop(application_id, None)
         return
 
-    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(3))
-    async def _call_llm(self, prompt_config: str, input_data: dict, output_schema: dict) -> dict:
-        chat_completion = await openai_client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": prompt_config},
-                {"role": "user", "content": json.dumps(input_data)},
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "response_schema",
-                    "schema": {**output_schema, "additionalProperties": False},
-                    "strict": True,
-                },
-            },
-            model=settings.OPENAI_MODEL,
-        )
-        return chat_completion
+    async def _call_llm(self, prompt_config: str, user_message: str, response_format: dict) -> dict:
+        # Inline retry with jittered exponential backoff; only transient
+        # errors are retried, 4xx schema/auth failures surface immediately.
+        for attempt in range(_LLM_RETRY_ATTEMPTS):
+            try:
+                async with _llm_semaphore:
+                    return await openai_client.chat.completions.create(
+                        messages=[
+                            {"role": "system", "content": prompt_config},
+                            {"role": "user", "content": user_message},
+                        ],
+                        response_format=response_format,
+                        model=settings.OPENAI_MODEL,
+                    )
+            except (RateLimitError, APIConnectionError, APITimeoutError):
+                if attempt == _LLM_RETRY_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(60, 2**attempt + random.random()))
 
     async def generate_completion(
         self,
@@ -90,60 +196,96 @@ class ApplicationService:
         input_data: dict,
     ) -> dict:
         application = await self.get_application(application_id)
+        user_message = orjson.dumps(input_data).decode()
+        input_validator, output_validator = _get_app_validators(application)
 
         try:
-            validate(instance=input_data, schema=application.input_schema)
-        except ValidationError as e:
+            input_validator(input_data)
+        except fastjsonschema.JsonSchemaException as e:
             raise InputValidationException(f"Input validation failed: {str(e)}")
 
         try:
             chat_completion = await self._call_llm(
-                prompt_config=application.prompt_config, input_data=input_data, output_schema=application.output_schema
+                prompt_config=application.prompt_config,
+                user_message=user_message,
+                response_format=application.response_format,
             )
         except Exception as e:
             raise LLMCallException(f"LLM call failed: {str(e)}")
 
         try:
-            output_data = json.loads(chat_completion.choices[0].message.content)
-            validate(instance=output_data, schema=application.output_schema)
-        except ValidationError as e:
+            output_data = orjson.loads(chat_completion.choices[0].message.content)
+            output_validator(output_data)
+        except fastjsonschema.JsonSchemaException as e:
             raise OutputValidationException(f"Output validation failed: {str(e)}")
 
-        completion_log = models.CompletionLog(
-            application_id=application_id, input_data=input_data, output_data=output_data
+        # Core insert: the log row needs no ORM identity, so skip the
+        # unit-of-work bookkeeping. The request session still commits once.
+        await self._session.execute(
+            insert(models.CompletionLog).values(
+                application_id=application_id, input_data=input_data, output_data=output_data
+            )
         )
-        self._session.add(completion_log)
         return output_data
 
     async def get_request_logs(
-        self, application_id: uuid.UUID, page: int, size: int
-    ) -> tuple[list[models.CompletionLog], int]:
+        self, application_id: uuid.UUID, page: int, size: int, cursor: str | None = None
+    ) -> tuple[list[models.CompletionLog], int, str | None]:
         await self.get_application(application_id)
 
-        offset = (page - 1) * size
-
+        # The scalar subquery folds the total into the page query (one
+        # round-trip) while counting only the application filter, so cursor
+        # pages still report the collection size rather than rows remaining.
+        total_subquery = (
+            select(func.count())
+            .select_from(models.CompletionLog)
+            .where(models.CompletionLog.application_id == application_id)
+            .scalar_subquery()
+            .label("total")
+        )
         logs_query = (
-            select(models.CompletionLog)
+            select(models.CompletionLog, total_subquery)
             .where(models.CompletionLog.application_id == application_id)
-            .order_by(models.CompletionLog.created_at.desc())
+            .order_by(models.CompletionLog.created_at.desc(), models.CompletionLog.id.desc())
             .limit(size)
-            .offset(offset)
         )
+        if cursor is not None:
+            # Keyset pagination: seek past the cursor row instead of scanning
+            # and discarding OFFSET rows, so deep pages stay O(size).
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+            logs_query = logs_query.where(
+                tuple_(models.CompletionLog.created_at, models.CompletionLog.id) < (cursor_created_at, cursor_id)
+            )
+        else:
+            logs_query = logs_query.offset((page - 1) * size)
+
         logs_result = await self._session.execute(logs_query)
-        paginated_logs = logs_result.scalars().all()
+        rows = logs_result.all()
 
-        count_query = (
-            select(func.count())
-            .select_from(models.CompletionLog)
-            .where(models.CompletionLog.application_id == application_id)
-        )
-        total_result = await self._session.execute(count_query)
-        total = total_result.scalar() or 0
+        paginated_logs = [log for log, _ in rows]
+        if rows:
+            total = rows[0].total
+        else:
+            # An empty page carries no window value; fall back to a count so
+            # out-of-range pages still report the real collection size.
+            count_query = (
+                select(func.count())
+                .select_from(models.CompletionLog)
+                .where(models.CompletionLog.application_id == application_id)
+            )
+            total = (await self._session.execute(count_query)).scalar() or 0
+        next_cursor = _encode_cursor(paginated_logs[-1]) if len(paginated_logs) == size else None
 
-        return paginated_logs, total
+        return paginated_logs, total, next_cursor
 
 
 async def get_application_service(
     session: AsyncSession = Depends(get_db_session),
 ) -> ApplicationService:
     return ApplicationService(session)
+
+
+async def get_readonly_application_service(
+    session: AsyncSession = Depends(get_readonly_db_session),
+) -> ApplicationService:
+    return ApplicationService(session)
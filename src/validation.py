@@ -0,0 +1,43 @@
+import functools
+import hashlib
+from typing import Any, Callable, Dict
+
+import fastjsonschema
+import orjson
+from jsonschema import Draft7Validator
+
+# Content hashes of schemas that already passed check_schema; lookups here
+# skip the full meta-schema walk for schemas seen before.
+_validated_hashes: set[bytes] = set()
+
+
+def _canonical(schema: Dict[str, Any]) -> bytes:
+    return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+
+
+def validate_schema(schema: Dict[str, Any]) -> None:
+    """Check a schema against the Draft 7 meta-schema, memoized by content hash.
+
+    Raises `jsonschema.SchemaError` for invalid schemas; schemas that already
+    passed are recognized by their blake2b digest and skipped in O(1).
+    """
+    schema_hash = hashlib.blake2b(_canonical(schema)).digest()
+    if schema_hash in _validated_hashes:
+        return
+    Draft7Validator.check_schema(schema)
+    _validated_hashes.add(schema_hash)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cached(schema_key: bytes) -> Callable[[Dict[str, Any]], Any]:
+    return fastjsonschema.compile(orjson.loads(schema_key))
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+    """Compile a JSON schema into a specialized validation callable.
+
+    Compiled validators are cached per canonical schema, so compiling the
+    same schema twice is free. The returned callable raises
+    `fastjsonschema.JsonSchemaException` when the instance does not match.
+    """
+    return _compile_cached(_canonical(schema))
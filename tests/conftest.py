@@ -0,0 +1,90 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient, Limits
+
+from src.main import app
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Serialized once at import so repeated POSTs skip httpx's per-call
+# json.dumps of the same payload.
+APPLICATION_REQUEST = {
+    "prompt_config": "Test prompt",
+    "input_schema": {"type": "object", "properties": {"input_key": {"type": "string"}}, "required": ["input_key"]},
+    "output_schema": {"type": "object", "properties": {"output_key": {"type": "string"}}, "required": ["output_key"]},
+}
+APPLICATION_REQUEST_BYTES = json.dumps(APPLICATION_REQUEST).encode()
+
+INFERENCE_REQUEST = {"input_data": {"input_key": "test input"}}
+INFERENCE_REQUEST_BYTES = json.dumps(INFERENCE_REQUEST).encode()
+
+NUM_SEEDED_COMPLETIONS = 25
+
+_LLM_RESPONSE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps({"output_key": "mocked_output"})))]
+)
+
+
+async def _fake_call_llm(*args, **kwargs):
+    return _LLM_RESPONSE
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_call_llm():
+    with patch("src.service.ApplicationService._call_llm", new=_fake_call_llm):
+        yield
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client():
+    # One transport and client for the whole run; closed by the async with
+    # on session teardown. ASGITransport never opens sockets, so disable
+    # everything the real pool would pay for: http2 negotiation, timeouts,
+    # and all but a token connection slot.
+    async with AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=True),
+        base_url="http://testserver",
+        http2=False,
+        timeout=None,
+        limits=Limits(max_connections=1),
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+async def application_id(client):
+    # Fresh application per test: several tests mutate state (completions,
+    # deletes), so sharing one would leak counts across tests.
+    response = await client.post("/applications", content=APPLICATION_REQUEST_BYTES, headers=JSON_HEADERS)
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    return response.json()["id"]
+
+
+@pytest.fixture(scope="module")
+async def seeded_application_id(client):
+    # Read-only application pre-loaded with NUM_SEEDED_COMPLETIONS logs,
+    # shared across the pagination tests so the seed cost is paid once.
+    response = await client.post("/applications", content=APPLICATION_REQUEST_BYTES, headers=JSON_HEADERS)
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    application_id = response.json()["id"]
+
+    completions_url = f"/applications/{application_id}/completions"
+    responses = await asyncio.gather(
+        *[
+            client.post(completions_url, content=INFERENCE_REQUEST_BYTES, headers=JSON_HEADERS)
+            for _ in range(NUM_SEEDED_COMPLETIONS)
+        ]
+    )
+    assert all(
+        response.status_code == 200 for response in responses
+    ), "Unexpected status code during completion seeding"
+    return application_id
@@ -1,43 +1,18 @@
-import json
+import math
 import uuid
-from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from conftest import INFERENCE_REQUEST_BYTES, JSON_HEADERS, NUM_SEEDED_COMPLETIONS
 
-from src.main import app
+pytestmark = pytest.mark.anyio
 
 
-@pytest.fixture(scope="module", autouse=True)
-def mock_call_llm():
-    with patch("src.service.ApplicationService._call_llm", new_callable=AsyncMock) as mock_method:
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content=json.dumps({"output_key": "mocked_output"})))]
-
-        mock_method.return_value = mock_response
-        yield
-
-
-@pytest.fixture(scope="session")
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.fixture(scope="session")
-async def client():
-    async with ASGITransport(app=app) as transport:
-        async with AsyncClient(transport=transport, base_url="http://localhost") as client:
-            yield client
-
-
-@pytest.mark.anyio
 async def test_health(client):
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-@pytest.mark.anyio
 async def test_create_application(client):
     request_data = {
         "prompt_config": "Test prompt",
@@ -50,7 +25,6 @@ async def test_create_application(client):
     assert "id" in response_data
 
 
-@pytest.mark.anyio
 async def test_create_application_invalid_schema(client):
     request_data = {
         "prompt_config": "Test prompt",
@@ -70,47 +44,18 @@ async def test_create_application_invalid_schema(client):
     assert "Schema validation error" in response.json()["detail"]
 
 
-@pytest.mark.anyio
-async def test_generate_completion(client):
-    # Create an application
-    request_data = {
-        "prompt_config": "Test prompt",
-        "input_schema": {"type": "object", "properties": {"input_key": {"type": "string"}}, "required": ["input_key"]},
-        "output_schema": {
-            "type": "object",
-            "properties": {"output_key": {"type": "string"}},
-            "required": ["output_key"],
-        },
-    }
-    response = await client.post("/applications", json=request_data)
-    assert response.status_code == 200
-    application_id = response.json()["id"]
-
+async def test_generate_completion(client, application_id):
     # Generate a completion
-    inference_request = {"input_data": {"input_key": "test input"}}
-    response = await client.post(f"/applications/{application_id}/completions", json=inference_request)
+    response = await client.post(
+        f"/applications/{application_id}/completions", content=INFERENCE_REQUEST_BYTES, headers=JSON_HEADERS
+    )
     assert response.status_code == 200
     response_data = response.json()
     assert "output_data" in response_data
     assert response_data["output_data"] == {"output_key": "mocked_output"}
 
 
-@pytest.mark.anyio
-async def test_generate_completion_invalid_input(client):
-    # Create an application
-    request_data = {
-        "prompt_config": "Test prompt",
-        "input_schema": {"type": "object", "properties": {"input_key": {"type": "string"}}, "required": ["input_key"]},
-        "output_schema": {
-            "type": "object",
-            "properties": {"output_key": {"type": "string"}},
-            "required": ["output_key"],
-        },
-    }
-    response = await client.post("/applications", json=request_data)
-    assert response.status_code == 200
-    application_id = response.json()["id"]
-
+async def test_generate_completion_invalid_input(client, application_id):
     # Generate a completion with invalid input
     inference_request = {"input_data": {"input_key": 123}}  # Invalid type, should be string
     response = await client.post(f"/applications/{application_id}/completions", json=inference_request)
@@ -118,22 +63,7 @@ async def test_generate_completion_invalid_input(client):
     assert "Input validation failed" in response.json()["detail"]
 
 
-@pytest.mark.anyio
-async def test_delete_application(client):
-    # Create an application
-    request_data = {
-        "prompt_config": "Test prompt",
-        "input_schema": {"type": "object", "properties": {"input_key": {"type": "string"}}, "required": ["input_key"]},
-        "output_schema": {
-            "type": "object",
-            "properties": {"output_key": {"type": "string"}},
-            "required": ["output_key"],
-        },
-    }
-    response = await client.post("/applications", json=request_data)
-    assert response.status_code == 200
-    application_id = response.json()["id"]
-
+async def test_delete_application(client, application_id):
     # Delete the application
     response = await client.delete(f"/applications/{application_id}")
     assert response.status_code == 204
@@ -144,52 +74,27 @@ async def test_delete_application(client):
     assert "Application not found" in response.json()["detail"]
 
 
-@pytest.mark.anyio
-async def test_get_request_logs_paginated(client):
-    # Create an application
-    request_data = {
-        "prompt_config": "Test prompt",
-        "input_schema": {"type": "object", "properties": {"input_key": {"type": "string"}}, "required": ["input_key"]},
-        "output_schema": {
-            "type": "object",
-            "properties": {"output_key": {"type": "string"}},
-            "required": ["output_key"],
-        },
-    }
-    response = await client.post("/applications", json=request_data)
-    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
-    application_id = response.json()["id"]
-
-    # Generate multiple completions to test pagination
-    num_completions = 25
-    for _ in range(num_completions):
-        inference_request = {"input_data": {"input_key": "test input"}}
-        response = await client.post(f"/applications/{application_id}/completions", json=inference_request)
-        assert response.status_code == 200, f"Unexpected status code during completion creation: {response.status_code}"
-
-    # Define pagination parameters
-    page = 2
-    size = 10
-
+@pytest.mark.parametrize("page,size,expected_items", [(1, 10, 10), (2, 10, 10), (3, 10, 5), (5, 10, 0)])
+async def test_get_request_logs_paginated(client, seeded_application_id, page, size, expected_items):
     # Get request logs with pagination
-    response = await client.get(f"/applications/{application_id}/completions/logs", params={"page": page, "size": size})
+    logs_url = f"/applications/{seeded_application_id}/completions/logs"
+    response = await client.get(logs_url, params={"page": page, "size": size})
     assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
 
     logs_response = response.json()
 
     # Validate response structure
     assert isinstance(logs_response, dict), "Response is not a dictionary"
-    assert "total" in logs_response, "Missing 'total' in response"
-    assert "page" in logs_response, "Missing 'page' in response"
-    assert "size" in logs_response, "Missing 'size' in response"
-    assert "total_pages" in logs_response, "Missing 'total_pages' in response"
-    assert "items" in logs_response, "Missing 'items' in response"
+    for key in ("total", "page", "size", "total_pages", "items"):
+        assert key in logs_response, f"Missing '{key}' in response"
 
     # Validate pagination metadata
-    assert logs_response["total"] == num_completions, f"Expected total {num_completions}, got {logs_response['total']}"
+    assert (
+        logs_response["total"] == NUM_SEEDED_COMPLETIONS
+    ), f"Expected total {NUM_SEEDED_COMPLETIONS}, got {logs_response['total']}"
     assert logs_response["page"] == page, f"Expected page {page}, got {logs_response['page']}"
     assert logs_response["size"] == size, f"Expected size {size}, got {logs_response['size']}"
-    expected_total_pages = (num_completions + size - 1) // size  # Ceiling division
+    expected_total_pages = math.ceil(NUM_SEEDED_COMPLETIONS / size)
     assert (
         logs_response["total_pages"] == expected_total_pages
     ), f"Expected total_pages {expected_total_pages}, got {logs_response['total_pages']}"
@@ -197,7 +102,6 @@ async def test_get_request_logs_paginated(client):
     # Validate items
     items = logs_response["items"]
     assert isinstance(items, list), "'items' is not a list"
-    expected_items = size if page < expected_total_pages else num_completions - size * (expected_total_pages - 1)
     assert len(items) == expected_items, f"Expected {expected_items} items on page {page}, got {len(items)}"
 
     for log in items:
@@ -207,7 +111,48 @@ async def test_get_request_logs_paginated(client):
         assert log["output_data"] == {"output_key": "mocked_output"}, "Incorrect 'output_data' in log"
 
 
-@pytest.mark.anyio
+async def test_get_request_logs_cursor(client, seeded_application_id):
+    num_completions = NUM_SEEDED_COMPLETIONS
+    size = 10
+    logs_url = f"/applications/{seeded_application_id}/completions/logs"
+
+    # Walk the whole log through the cursor envelope
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"size": size}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get(logs_url, params=params)
+        assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+
+        logs_response = response.json()
+        assert "next_cursor" in logs_response, "Missing 'next_cursor' in response"
+
+        # Every cursor page reports the application's full log count, not the
+        # rows remaining past the cursor.
+        assert (
+            logs_response["total"] == num_completions
+        ), f"Expected total {num_completions}, got {logs_response['total']}"
+        expected_total_pages = math.ceil(num_completions / size)
+        assert (
+            logs_response["total_pages"] == expected_total_pages
+        ), f"Expected total_pages {expected_total_pages}, got {logs_response['total_pages']}"
+
+        seen_ids.extend(log["id"] for log in logs_response["items"])
+
+        cursor = logs_response["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen_ids) == num_completions, f"Expected {num_completions} logs via cursor, got {len(seen_ids)}"
+    assert len(set(seen_ids)) == num_completions, "Cursor pages overlapped or repeated logs"
+
+    # An undecodable cursor is rejected
+    response = await client.get(logs_url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400, f"Expected 400 for an invalid cursor, got {response.status_code}"
+
+
 async def test_get_request_logs_nonexistent_application_paginated(client):
     # Generate a random UUID for a non-existent application
     non_existent_application_id = str(uuid.uuid4())